@@ -20,7 +20,6 @@ from .models import (
     UserSummary,
 )
 from .partitions import partition_bucket
-from .resources import parse_usage
 from .slurm import parse_jobs, parse_nodelist
 
 def shard_equivalent(server: ServerState, gpu_count: float) -> float:
@@ -53,7 +52,6 @@ def process_jobs(
         if job.state != "RUNNING":
             continue
 
-        usage = parse_usage(job.usage_str)
         nodes = parse_nodelist(job.nodelist)
         if not nodes:
             if stderr_console is not None:
@@ -68,7 +66,8 @@ def process_jobs(
             stderr_console.print(
                 Text(
                     f"Processing job {job.job_id}: {job.user}@{job.partition}, "
-                    f"nodes: {len(nodes)}, usage: {usage}",
+                    f"nodes: {len(nodes)}, "
+                    f"usage: cpu={job.cpu} gpu={job.gpu} mem={job.mem} shard={job.shard}",
                     style="dim",
                 )
             )
@@ -77,38 +76,43 @@ def process_jobs(
             if debug_enabled and stderr_console is not None:
                 stderr_console.print(
                     Text(
-                        f"Skipping job {job.job_id}: nodes {nodes} not in server list",
+                        f"Skipping job {job.job_id}: nodes {list(nodes)} not in server list",
                         style="dim",
                     )
                 )
             continue
 
-        per_node = {
-            resource: getattr(usage, resource) / len(matched_nodes)
-            for resource in JOB_RESOURCE_NAMES
-        }
+        node_count = len(matched_nodes)
+        cpu_per_node = job.cpu / node_count
+        gpu_per_node = job.gpu / node_count
+        mem_per_node = job.mem / node_count
+        shard_per_node = job.shard / node_count
+        partition = job.partition
         for node in matched_nodes:
-            shard_amount = per_node["shard"]
-            if shard_amount <= 0 and per_node["gpu"] > 0:
-                shard_amount = shard_equivalent(servers[node], per_node["gpu"])
+            server = servers[node]
+            shard_amount = shard_per_node
+            if shard_amount <= 0 and gpu_per_node > 0:
+                shard_amount = shard_equivalent(server, gpu_per_node)
             if store_users:
-                servers[node].users[job.job_id] = JobAllocation(
+                server.users[job.job_id] = JobAllocation(
                     netid=job.user,
                     job_id=job.job_id,
                     job_name=job.job_name,
                     state=job.state,
-                    partition=job.partition,
+                    partition=partition,
                     nodelist=job.nodelist,
                     usage_str=job.usage_str,
                     time_limit=job.time_limit,
-                    cpu=per_node["cpu"],
-                    gpu=per_node["gpu"],
-                    mem=per_node["mem"],
+                    cpu=cpu_per_node,
+                    gpu=gpu_per_node,
+                    mem=mem_per_node,
                     shard=shard_amount,
                 )
-            for resource in JOB_RESOURCE_NAMES:
-                amount = shard_amount if resource == "shard" else per_node[resource]
-                servers[node].usage[resource].add(job.partition, amount)
+            usage = server.usage
+            usage["cpu"].add(partition, cpu_per_node)
+            usage["gpu"].add(partition, gpu_per_node)
+            usage["mem"].add(partition, mem_per_node)
+            usage["shard"].add(partition, shard_amount)
         processed_jobs += 1
 
     if debug_enabled and stderr_console is not None:
@@ -139,8 +143,7 @@ def build_top_users_summary(
         if target_users and job.user not in target_users:
             continue
 
-        usage = parse_usage(job.usage_str)
-        resource_count = int(usage.shard if show_shards else usage.gpu)
+        resource_count = int(job.shard if show_shards else job.gpu)
         if resource_count <= 0:
             continue
 
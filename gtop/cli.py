@@ -51,7 +51,7 @@ from .render import (
     visible_servers,
 )
 from .models import ClusterState
-from .runner import CommandRunner, SubprocessRunner
+from .runner import CommandRunner, SubprocessRunner, run_commands
 from .slurm import parse_jobs, parse_nodelist, parse_sinfo
 
 
@@ -475,18 +475,26 @@ def cli_main(
     active_console = console or Console()
     active_stderr = stderr_console or Console(stderr=True)
     active_runner = runner or SubprocessRunner()
-    target_users: Set[str] = set(args.users) if args.users else set()
+    target_users: Set[str] = {sys.intern(user) for user in args.users or ()}
     current_user = getpass.getuser() if (args.me or args.mine) else None
     if args.me:
         assert current_user is not None
-        target_users.add(current_user)
+        target_users.add(sys.intern(current_user))
     target_user_filter: Optional[Set[str]] = target_users or None
     partition_filter = tuple(args.partition) if args.partition else None
     partition_scope_source = "explicit" if partition_filter else None
     if args.mine:
         assert current_user is not None
-        assoc_command = _user_partition_assoc_command(current_user)
-        assoc_result = active_runner.run(assoc_command, args.timeout)
+        scope_results = run_commands(
+            {
+                "assoc": _user_partition_assoc_command(current_user),
+                "known_partitions": _known_partitions_command(),
+            },
+            timeout=args.timeout,
+            runner=active_runner,
+            parallel=not args.no_parallel,
+        )
+        assoc_result = scope_results["assoc"]
         if assoc_result.returncode != 0:
             active_stderr.print(
                 Text(
@@ -497,7 +505,7 @@ def cli_main(
             if assoc_result.stderr:
                 active_stderr.print(Text(assoc_result.stderr.strip(), style="red"))
             return EXIT_COMMAND_ERROR
-        known_partitions_result = active_runner.run(_known_partitions_command(), args.timeout)
+        known_partitions_result = scope_results["known_partitions"]
         if known_partitions_result.returncode != 0:
             active_stderr.print(
                 Text(
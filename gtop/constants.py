@@ -2,7 +2,7 @@ DEFAULT_TIMEOUT = 120
 
 SACCT_COMMAND = (
     "sacct -a -X -n -P --state=RUNNING "
-    "--format=User%10,Jobid%10,JobName%20,State,Partition%40,NodeList%40,AllocTRES%120,TimeLimit%12 "
+    "--format=User,Jobid,JobName,State,Partition,NodeList,AllocTRES,TimeLimit "
     "--units=G"
 )
 JOBS_SACCT_COMMAND = (
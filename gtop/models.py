@@ -42,8 +42,12 @@ class ResourceUsageSplit:
     def add(self, partition_name: str, amount: float) -> None:
         self.partitions[partition_name] = self.partitions.get(partition_name, 0.0) + amount
         bucket = partition_bucket(partition_name)
-        if bucket is not None:
-            setattr(self, bucket, getattr(self, bucket) + amount)
+        if bucket == "priority":
+            self.priority += amount
+        elif bucket == "gpu":
+            self.gpu += amount
+        elif bucket == "default":
+            self.default += amount
 
     def items(self):
         if self.partitions:
@@ -55,7 +59,7 @@ class ResourceUsageSplit:
         }.items()
 
 
-@dataclass
+@dataclass(frozen=True)
 class JobUsage:
     cpu: float = 0.0
     gpu: float = 0.0
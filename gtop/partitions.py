@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 
 SEMANTIC_PARTITIONS = ("priority", "gpu", "default")
 
 
+@lru_cache(maxsize=None)
 def partition_bucket(name: str) -> str | None:
     lower_name = name.lower()
     if "default" in lower_name:
@@ -87,6 +87,7 @@ def _top_user_label(user: str) -> str:
     return f"{user} ({full_name})"
 
 
+@lru_cache(maxsize=None)
 def _partition_color(partition: str) -> str:
     bucket = partition_bucket(partition)
     if bucket == "priority":
@@ -202,11 +203,10 @@ def format_resource(server: ServerState, res: str, show_shards: bool = False) ->
     usage_info = _resource_split(server, res, show_shards)
     partition_amounts = _usage_partitions(usage_info)
     segments, semantic_mode = _partition_segments(partition_amounts)
-    if semantic_mode:
-        totals = _semantic_partition_totals(partition_amounts)
-        priority = totals["priority"]
-        gpu = totals["gpu"]
-        default = totals["default"]
+    if semantic_mode and segments:
+        (_, priority, _), (_, gpu, _), (_, default, _) = segments
+    elif semantic_mode:
+        priority = gpu = default = 0
     else:
         priority = sum(count for _, count, _ in segments)
         gpu = 0
@@ -214,15 +214,15 @@ def format_resource(server: ServerState, res: str, show_shards: bool = False) ->
 
     if res == "cpu":
         idle = server.cpu.idle
-        return f"{int(priority):2d}/{int(gpu):2d}/{int(default):2d}/{int(idle):2d}"
+        return "%2d/%2d/%2d/%2d" % (priority, gpu, default, idle)
     if res == "gpu":
         gpu_info = server.gpu
         total = gpu_info.shards if show_shards and gpu_info.shards > 0 else gpu_info.num
         idle = max(total - priority - gpu - default, 0)
-        return f"{int(priority)}/{int(gpu)}/{int(default)}/{int(idle)}"
+        return "%d/%d/%d/%d" % (priority, gpu, default, idle)
 
     idle = server.mem.idle / 1024.0
-    return f"{int(priority):3d}/{int(gpu):3d}/{int(default):3d}/{int(idle):3d}"
+    return "%3d/%3d/%3d/%3d" % (priority, gpu, default, idle)
 
 
 def sort_server_names(
@@ -247,17 +247,16 @@ def sort_server_names(
             )
         ]
     if sort_by == "free-gpu":
+
+        def free_resources(server: ServerState) -> float:
+            used, total = _resource_totals(server, show_shards=show_shards)
+            return total - used
+
         return [
             name
             for name, _ in sorted(
                 items,
-                key=lambda item: (
-                    -(
-                        _resource_totals(item[1], show_shards=show_shards)[1]
-                        - _resource_totals(item[1], show_shards=show_shards)[0]
-                    ),
-                    item[0],
-                ),
+                key=lambda item: (-free_resources(item[1]), item[0]),
             )
         ]
     if sort_by == "used-gpu":
@@ -296,11 +295,14 @@ def visible_servers(
     sort_by: str,
     show_shards: bool = False,
 ) -> List[ServerState]:
+    if target_users:
+        servers = {
+            name: server
+            for name, server in servers.items()
+            if server.has_target_users(target_users)
+        }
     sorted_names = sort_server_names(servers, sort_by, show_shards=show_shards)
-    visible = [servers[name] for name in sorted_names]
-    if not target_users:
-        return visible
-    return [server for server in visible if server.has_target_users(target_users)]
+    return [servers[name] for name in sorted_names]
 
 
 def print_summary(
@@ -312,29 +314,36 @@ def print_summary(
     show_target_users: bool = True,
 ) -> None:
     active_console = console or Console()
+    renderables: list[Any] = []
 
     if show_overview:
         if summary.gpu_total > 0:
-            active_console.print(
-                "[bold yellow]Cluster GPU Overview: "
-                f"{int(summary.gpu_used)}/{summary.gpu_total} GPUs Used "
-                f"({summary.gpu_utilization_pct:.1f}%)[/]"
+            renderables.append(
+                Text(
+                    "Cluster GPU Overview: "
+                    f"{int(summary.gpu_used)}/{summary.gpu_total} GPUs Used "
+                    f"({summary.gpu_utilization_pct:.1f}%)",
+                    style="bold yellow",
+                )
             )
         else:
-            active_console.print("[bold yellow]Cluster GPU Overview: No GPUs detected[/]")
+            renderables.append(
+                Text("Cluster GPU Overview: No GPUs detected", style="bold yellow")
+            )
 
     target_user_summary = summary.target_users
     if show_top_users and summary.top_users:
-        active_console.print(Text("Top Users", style="bold cyan"))
-        active_console.print(_build_top_users_table(summary))
-        active_console.print()
+        renderables.append(Text("Top Users", style="bold cyan"))
+        renderables.append(_build_top_users_table(summary))
+        renderables.append(Text(""))
 
-    if not show_target_users or not target_user_summary:
-        return
+    if show_target_users and target_user_summary:
+        renderables.append(Text("\n" + "=" * 80, style="bright_white"))
+        renderables.append(Text("Summary of Resources Used by Specified Users", style="bold"))
+        renderables.append(Text("=" * 80, style="bright_white"))
 
-    active_console.print("\n" + "=" * 80, style="bright_white")
-    active_console.print("[bold]Summary of Resources Used by Specified Users[/]")
-    active_console.print("=" * 80, style="bright_white")
+    if renderables:
+        active_console.print(Group(*renderables))
 
 
 def print_filtered_users(
@@ -351,7 +360,7 @@ def print_filtered_users(
     if not visible_users:
         return
 
-    active_console.print(Text("Filtered Users", style="bold cyan"))
+    lines = [Text("Filtered Users", style="bold cyan")]
     for user, stats in visible_users:
         node_count = len(stats.nodes)
         total_usage = stats.total_usage()
@@ -366,8 +375,9 @@ def print_filtered_users(
             line.append("  ")
             line.append(f"{partition}:", style="white")
             line.append(str(count), style=f"bold {_partition_color(partition)}")
-        active_console.print(line)
-    active_console.print()
+        lines.append(line)
+    lines.append(Text(""))
+    active_console.print(Group(*lines))
 
 
 def _build_jobs_table(
@@ -1231,7 +1241,7 @@ def _group_header_summary(
     return summary
 
 
-def _build_group_header_table(
+def _build_group_header(
     gpu_type: str,
     count: int,
     total_count: int,
@@ -1239,20 +1249,19 @@ def _build_group_header_table(
     group_width: int,
     show_shards: bool,
     show_used: bool,
-) -> Table:
-    table = Table.grid(padding=(0, GROUP_GAP), expand=False)
-    table.add_column(width=group_width, no_wrap=True)
-    table.add_column(no_wrap=True)
-    table.add_row(
-        Text(_pad(gpu_type, group_width), style="bold cyan"),
+) -> Text:
+    line = Text(no_wrap=True)
+    line.append(_pad(gpu_type, group_width), style="bold cyan")
+    line.append(" " * GROUP_GAP)
+    line.append_text(
         _group_header_summary(
             count,
             total_count,
             show_shards=show_shards,
             show_used=show_used,
-        ),
+        )
     )
-    return table
+    return line
 
 
 def _cluster_overview_summary(
@@ -1294,25 +1303,24 @@ def _cluster_overview_summary(
     return summary
 
 
-def _build_cluster_overview_table(
+def _build_cluster_overview(
     servers: Sequence[ServerState],
     *,
     show_shards: bool,
     show_used: bool,
     overview_title: str,
-) -> Table:
-    table = Table.grid(padding=(0, 2), expand=False)
-    table.add_column(no_wrap=True)
-    table.add_column(no_wrap=True)
-    table.add_row(
-        Text(overview_title, style="bold cyan"),
+) -> Text:
+    line = Text(no_wrap=True)
+    line.append(overview_title, style="bold cyan")
+    line.append("  ")
+    line.append_text(
         _cluster_overview_summary(
             servers,
             show_shards=show_shards,
             show_used=show_used,
-        ),
+        )
     )
-    return table
+    return line
 
 
 def _build_nodes_table(
@@ -1510,7 +1518,7 @@ def render_table(
     )
     renderables: list[Any] = []
     renderables.append(
-        _build_cluster_overview_table(
+        _build_cluster_overview(
             servers,
             show_shards=show_shards,
             show_used=show_used,
@@ -1561,7 +1569,7 @@ def render_table(
         if index > 0:
             renderables.append(Text(""))
         renderables.append(
-            _build_group_header_table(
+            _build_group_header(
                 gpu_type,
                 count,
                 total_gpus,
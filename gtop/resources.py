@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import List
 
 from .models import CpuInfo, GpuInfo, JobUsage, MemoryInfo
 
+_DIGITS = re.compile(r"\d+")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_TRES_PAIR = re.compile(r"([^,=]+)=([^,]*)")
+
 
 def _split_outside_parens(value: str, delimiter: str = ",") -> List[str]:
+    if "(" not in value:
+        return value.split(delimiter)
+
     parts: List[str] = []
     start = 0
     depth = 0
@@ -25,6 +33,9 @@ def _split_outside_parens(value: str, delimiter: str = ",") -> List[str]:
 
 
 def _split_gres_components(item: str) -> List[str]:
+    if "(" not in item:
+        return [part.strip() for part in item.split(":") if part.strip()]
+
     parts: List[str] = []
     start = 0
     depth = 0
@@ -43,7 +54,7 @@ def _split_gres_components(item: str) -> List[str]:
 
 
 def _extract_count(value: str) -> int:
-    match = re.search(r"\d+", value)
+    match = _DIGITS.search(value)
     return int(match.group(0)) if match else 0
 
 
@@ -135,7 +146,7 @@ def _parse_numeric(value: str) -> float:
     if lowered in {"(null)", "none"}:
         return 0.0
 
-    match = re.search(r"\d+(?:\.\d+)?", lowered)
+    match = _NUMBER.search(lowered)
     return float(match.group(0)) if match else 0.0
 
 
@@ -173,29 +184,30 @@ def parse_mem(alloc_mem: str, total_mem: str) -> MemoryInfo:
     return MemoryInfo(idle=max(total - alloc, 0.0), total=total)
 
 
+@lru_cache(maxsize=2048)
 def parse_usage(alloc_tres: str) -> JobUsage:
-    usage = JobUsage()
     if not alloc_tres:
-        return usage
+        return JobUsage()
 
+    cpu = 0.0
+    gpu = 0.0
+    mem = 0.0
+    shard = 0.0
     seen_generic_gpu = False
     seen_generic_shard = False
-    for part in alloc_tres.split(","):
-        if "=" not in part:
-            continue
-        key, value = part.split("=", 1)
+    for key, value in _TRES_PAIR.findall(alloc_tres):
         if key == "cpu":
-            usage.cpu = _parse_tres_value(value)
+            cpu = _parse_tres_value(value)
         elif key == "mem":
-            usage.mem = _parse_tres_value(value, default_unit="G")
+            mem = _parse_tres_value(value, default_unit="G")
         elif key == "gres/gpu":
-            usage.gpu = _parse_tres_value(value)
+            gpu = _parse_tres_value(value)
             seen_generic_gpu = True
         elif key.startswith("gres/gpu:") and not seen_generic_gpu:
-            usage.gpu += _parse_tres_value(value)
+            gpu += _parse_tres_value(value)
         elif key == "gres/shard":
-            usage.shard = _parse_tres_value(value)
+            shard = _parse_tres_value(value)
             seen_generic_shard = True
         elif key.startswith("gres/shard:") and not seen_generic_shard:
-            usage.shard += _parse_tres_value(value)
-    return usage
+            shard += _parse_tres_value(value)
+    return JobUsage(cpu=cpu, gpu=gpu, mem=mem, shard=shard)
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import re
+import shlex
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from subprocess import PIPE, Popen, TimeoutExpired
-from typing import Dict, Mapping, Optional, Protocol
+from typing import Dict, List, Mapping, Optional, Protocol
+
+_SHELL_OPERATOR_CHARS = frozenset("();<>|&")
+_SHELL_EXPANSION_CHARS = frozenset("$`*?[~#\n")
+_ENV_ASSIGNMENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*=")
+_SHELL_BUILTINS = frozenset(
+    {
+        "!", ".", ":", "[[", "{", "alias", "builtin", "case", "cd", "command",
+        "coproc", "declare", "do", "done", "elif", "else", "esac", "eval", "exec",
+        "exit", "export", "fi", "for", "function", "if", "local", "readonly",
+        "return", "select", "set", "shift", "source", "then", "time", "trap",
+        "ulimit", "umask", "unset", "until", "wait", "while",
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -19,28 +34,53 @@ class CommandRunner(Protocol):
         ...
 
 
+def _command_argv(command: str) -> Optional[List[str]]:
+    if any(char in _SHELL_EXPANSION_CHARS for char in command):
+        return None
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        return None
+    if not tokens or any(set(token) <= _SHELL_OPERATOR_CHARS for token in tokens):
+        return None
+    if _ENV_ASSIGNMENT.match(tokens[0]) or tokens[0] in _SHELL_BUILTINS:
+        return None
+    return tokens
+
+
 class SubprocessRunner:
     def run(self, command: str, timeout: int) -> CommandResult:
+        argv = _command_argv(command)
+        args, shell = (command, True) if argv is None else (argv, False)
         try:
-            process = Popen(command, shell=True, stdout=PIPE, stderr=PIPE)
-            stdout_bytes, stderr_bytes = process.communicate(timeout=timeout)
+            process = Popen(
+                args,
+                shell=shell,
+                stdout=PIPE,
+                stderr=PIPE,
+                encoding="utf-8",
+                errors="replace",
+            )
+            stdout, stderr = process.communicate(timeout=timeout)
             return CommandResult(
                 command=command,
-                stdout=stdout_bytes.decode("utf-8"),
-                stderr=stderr_bytes.decode("utf-8"),
+                stdout=stdout,
+                stderr=stderr,
                 returncode=process.returncode,
             )
         except TimeoutExpired:
             process.kill()
-            stdout_bytes, stderr_bytes = process.communicate()
-            stderr = stderr_bytes.decode("utf-8")
+            stdout, stderr = process.communicate()
             if stderr:
                 stderr = f"{stderr}\nTimed out after {timeout} seconds"
             else:
                 stderr = f"Timed out after {timeout} seconds"
             return CommandResult(
                 command=command,
-                stdout=stdout_bytes.decode("utf-8"),
+                stdout=stdout,
                 stderr=stderr,
                 returncode=-1,
             )
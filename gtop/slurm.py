@@ -1,52 +1,48 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from .constants import SINFO_FIELD_WIDTHS
 from .models import JobRecord, ServerState
 from .resources import parse_cpu, parse_gpu, parse_mem, parse_usage
 
+_TOP_LEVEL_COMMA = re.compile(r",(?![^\[]*\])")
 
-def expand_range(value: str) -> List[str]:
+
+@lru_cache(maxsize=4096)
+def expand_range(value: str) -> Tuple[str, ...]:
     if "-" not in value:
-        return [value]
+        return (value,)
 
     try:
         start_str, end_str = value.split("-", 1)
         start = int(start_str)
         end = int(end_str)
         width = max(len(start_str), len(end_str))
-        return [str(number).zfill(width) for number in range(start, end + 1)]
+        return tuple(str(number).zfill(width) for number in range(start, end + 1))
     except ValueError:
-        return [value]
-
+        return (value,)
 
-def parse_nodelist(nodelist: str) -> List[str]:
-    nodes: List[str] = []
-    bracket_depth = 0
-    start = 0
 
-    for index, char in enumerate(nodelist):
-        if char == "[":
-            bracket_depth += 1
-        elif char == "]":
-            bracket_depth -= 1
-        elif char == "," and bracket_depth == 0:
-            nodes.append(nodelist[start:index])
-            start = index + 1
-    nodes.append(nodelist[start:])
+@lru_cache(maxsize=4096)
+def parse_nodelist(nodelist: str) -> Tuple[str, ...]:
+    if "[" not in nodelist:
+        return tuple(nodelist.split(","))
 
     expanded: List[str] = []
-    for node in nodes:
-        if "[" in node and "]" in node:
-            base = node[: node.find("[")]
-            ranges = node[node.find("[") + 1 : node.find("]")]
+    for node in _TOP_LEVEL_COMMA.split(nodelist):
+        base, bracket, rest = node.partition("[")
+        ranges, closing, _ = rest.partition("]")
+        if bracket and closing:
             for item in ranges.split(","):
                 for suffix in expand_range(item):
                     expanded.append(base + suffix)
         else:
             expanded.append(node)
-    return expanded
+    return tuple(expanded)
 
 
 def parse_features_field(features: str) -> set[str]:
@@ -64,11 +60,18 @@ def parse_features_field(features: str) -> set[str]:
     return set(parsed)
 
 
+def _split_pipe_fields(line: str) -> List[str]:
+    parts = line.split("|")
+    if " " not in line and "\t" not in line:
+        return parts
+    return [segment.strip() for segment in parts]
+
+
 def _split_job_line(line: str) -> Optional[List[str]]:
     if not line:
         return None
     if "|" in line:
-        parts = [segment.strip() for segment in line.rstrip("|").split("|")]
+        parts = _split_pipe_fields(line.rstrip("|"))
     else:
         parts = line.split()
     return parts if len(parts) >= 6 else None
@@ -76,10 +79,7 @@ def _split_job_line(line: str) -> Optional[List[str]]:
 
 def parse_jobs(output: str) -> List[JobRecord]:
     jobs: List[JobRecord] = []
-    if not output.strip():
-        return jobs
-
-    for line in output.strip().splitlines():
+    for line in output.splitlines():
         parts = _split_job_line(line.strip())
         if not parts:
             continue
@@ -89,6 +89,8 @@ def parse_jobs(output: str) -> List[JobRecord]:
             user, partition, nodelist, state, usage_str, job_id = parts[:6]
             job_name = ""
             time_limit = ""
+        user = sys.intern(user)
+        partition = sys.intern(partition)
         usage = parse_usage(usage_str)
         jobs.append(
             JobRecord(
@@ -113,7 +115,7 @@ def _split_sinfo_line(line: str) -> Optional[List[str]]:
     if not line:
         return None
     if "|" in line:
-        parts = [segment.strip() for segment in line.split("|")]
+        parts = _split_pipe_fields(line)
         return parts if len(parts) >= 7 else None
 
     fields: List[str] = []
@@ -127,7 +129,7 @@ def _split_sinfo_line(line: str) -> Optional[List[str]]:
 
 def parse_sinfo(output: str, gpu_only: bool) -> Dict[str, ServerState]:
     servers: Dict[str, ServerState] = {}
-    for raw_line in output.strip().splitlines():
+    for raw_line in output.splitlines():
         line = raw_line.rstrip("\n")
         if not line.strip():
             continue
@@ -2,6 +2,8 @@
 
 import io
 import json
+import threading
+from subprocess import Popen
 from unittest.mock import patch
 
 import pytest
@@ -18,6 +20,7 @@ from gtop import (
     JOBS_SACCT_COMMAND,
     SACCT_COMMAND,
     SINFO_COMMAND,
+    SubprocessRunner,
     cli_main,
     collect_cluster_state,
 )
@@ -41,6 +44,17 @@ class FakeRunner:
         return self.responses[command]
 
 
+class BarrierRunner(FakeRunner):
+    def __init__(self, responses, parties: int):
+        super().__init__(responses)
+        self.barrier = threading.Barrier(parties)
+
+    def run(self, command: str, timeout: int) -> CommandResult:
+        result = super().run(command, timeout)
+        self.barrier.wait(timeout=5)
+        return result
+
+
 class RecordingConsole:
     def __init__(self):
         self.calls = []
@@ -253,6 +267,39 @@ def test_cli_mine_auto_detects_scope():
     ]
 
 
+def test_cli_mine_runs_scope_queries_in_parallel():
+    assoc_command = _user_partition_assoc_command("alice")
+    known_partitions_command = _known_partitions_command()
+    runner = BarrierRunner(
+        {
+            assoc_command: make_result(assoc_command, "cornell|\n"),
+            known_partitions_command: make_result(
+                known_partitions_command,
+                "",
+                returncode=1,
+                stderr="boom",
+            ),
+        },
+        parties=2,
+    )
+
+    with patch("gtop.cli.getpass.getuser", return_value="alice"):
+        code = cli_main(
+            ["--mine"],
+            runner=runner,
+            console=RecordingConsole(),
+            stderr_console=RecordingConsole(),
+        )
+
+    assert code == EXIT_COMMAND_ERROR
+    assert sorted(runner.calls) == sorted(
+        [
+            (assoc_command, DEFAULT_TIMEOUT),
+            (known_partitions_command, DEFAULT_TIMEOUT),
+        ]
+    )
+
+
 def test_cli_no_matches_exit_code():
     sinfo_output, _ = make_small_cluster_outputs()
     runner = FakeRunner(
@@ -447,18 +494,18 @@ def test_cli_does_not_print_top_users_by_default():
             SACCT_COMMAND: make_result(SACCT_COMMAND, sacct_output),
         }
     )
-    stdout = RecordingConsole()
+    stream = io.StringIO()
+    console = Console(file=stream, width=160, force_terminal=False)
 
     code = cli_main(
         [],
         runner=runner,
-        console=stdout,
+        console=console,
         stderr_console=RecordingConsole(),
     )
 
     assert code == EXIT_SUCCESS
-    printed_strings = [args[0] for args, _ in stdout.calls if args and isinstance(args[0], str)]
-    assert not any("Top Users" in text for text in printed_strings)
+    assert "Top Users" not in stream.getvalue()
 
 
 def test_cli_default_table_uses_compact_resource_schema():
@@ -1309,20 +1356,21 @@ def test_cli_top_users_only_mode_hides_other_sections():
             SACCT_COMMAND: make_result(SACCT_COMMAND, sacct_output),
         }
     )
-    stdout = RecordingConsole()
+    stream = io.StringIO()
+    console = Console(file=stream, width=160, force_terminal=False)
 
     code = cli_main(
         ["-U"],
         runner=runner,
-        console=stdout,
+        console=console,
         stderr_console=RecordingConsole(),
     )
 
-    printed_strings = [str(args[0]) for args, _ in stdout.calls if args]
+    output = stream.getvalue()
     assert code == EXIT_SUCCESS
-    assert any("Top Users" in text for text in printed_strings)
-    assert not any("Cluster GPU Overview" in text for text in printed_strings)
-    assert not any("Summary of Resources Used by Specified Users" in text for text in printed_strings)
+    assert "Top Users" in output
+    assert "Cluster GPU Overview" not in output
+    assert "Summary of Resources Used by Specified Users" not in output
 
 
 def test_cli_top_users_default_count_is_25():
@@ -2204,3 +2252,46 @@ def test_cli_me_verbose_job_headers_align_gpu_type_column():
     }
     assert code == EXIT_SUCCESS
     assert header_lines["n1"].index("A40") == header_lines["very-long-node-name"].index("B200")
+
+
+def test_subprocess_runner_execs_simple_commands_without_shell():
+    with patch("gtop.runner.Popen", wraps=Popen) as popen:
+        result = SubprocessRunner().run("printf '%s' 'a|b'", 5)
+
+    assert result.returncode == 0
+    assert result.stdout == "a|b"
+    assert popen.call_args.args[0] == ["printf", "%s", "a|b"]
+    assert popen.call_args.kwargs["shell"] is False
+
+
+def test_subprocess_runner_falls_back_to_shell_for_pipelines():
+    result = SubprocessRunner().run("printf 'RUNNING\\nPENDING\\n' | grep RUNNING", 5)
+
+    assert result.returncode == 0
+    assert result.stdout == "RUNNING\n"
+
+
+@pytest.mark.parametrize(
+    ("command", "expected_stdout"),
+    [
+        ("FOO=1 printenv FOO", "1\n"),
+        ("echo a#b", "a#b\n"),
+        ("echo /etc/host*", None),
+        ("echo ~", None),
+        ("echo one\necho two", "one\ntwo\n"),
+        ("exec echo hi", "hi\n"),
+        ("command echo hi", "hi\n"),
+        ("eval echo hi", "hi\n"),
+    ],
+)
+def test_subprocess_runner_falls_back_to_shell_for_shell_syntax(command, expected_stdout):
+    with patch("gtop.runner.Popen", wraps=Popen) as popen:
+        result = SubprocessRunner().run(command, 5)
+
+    assert result.returncode == 0
+    assert popen.call_args.kwargs.get("shell") is True
+    if expected_stdout is not None:
+        assert result.stdout == expected_stdout
+    else:
+        assert "*" not in result.stdout
+        assert "~" not in result.stdout
@@ -111,6 +111,15 @@ def test_shard_job_no_double_counting():
     assert result.shard == 12
 
 
+def test_repeated_tres_strings_share_parsed_usage():
+    """Test identical AllocTRES strings (e.g. job arrays) are parsed once"""
+
+    tres = "billing=8,cpu=8,gres/gpu=1,mem=32G,node=1"
+
+    assert parse_usage(tres) is parse_usage(tres)
+    assert parse_usage(tres).gpu == 1
+
+
 def test_null_gres():
     """Test null/empty GRES handling"""
 
@@ -15,7 +15,13 @@ from gtop import (
 from gtop.accounting import process_jobs
 from gtop.constraints import matches_constraint
 from gtop.resources import parse_gpu
-from gtop.slurm import expand_range, parse_features_field, parse_sinfo
+from gtop.slurm import (
+    expand_range,
+    parse_features_field,
+    parse_jobs,
+    parse_nodelist,
+    parse_sinfo,
+)
 
 FIXTURE_DIR = Path(__file__).resolve().parent
 
@@ -324,6 +330,22 @@ def test_process_jobs_converts_gpu_usage_to_shards_on_sharded_nodes():
     assert dutta.users["12345"].shard == 48
 
 
+def test_process_jobs_uses_parsed_job_usage():
+    servers = parse_sinfo(read_fixture("sinfo-output-unicorn.txt"), gpu_only=False)
+    jobs = parse_jobs(
+        "alice|gpu|dutta-compute-01|RUNNING|"
+        "billing=8,cpu=8,gres/gpu=2,mem=64G,node=1|12345|"
+    )
+    jobs[0].usage_str = ""
+
+    process_jobs(jobs, servers)
+
+    dutta = servers["dutta-compute-01"]
+    assert dutta.usage["gpu"].gpu == 2
+    assert dutta.usage["cpu"].gpu == 8
+    assert dutta.users["12345"].mem == 64
+
+
 def test_sinfo_command_requests_per_node_output():
     assert " -N " in f" {SINFO_COMMAND} "
 
@@ -334,6 +356,27 @@ def test_sacct_command_requests_all_users():
     assert " -a " in f" {SACCT_COMMAND} "
 
 
+def test_sacct_command_filters_running_jobs_server_side():
+    from gtop import SACCT_COMMAND
+
+    tokens = SACCT_COMMAND.split()
+    assert "--state=RUNNING" in tokens
+    assert "-P" in tokens
+    assert "-n" in tokens
+
+
 def test_expand_range_preserves_original_width():
-    assert expand_range("1-3") == ["1", "2", "3"]
-    assert expand_range("01-03") == ["01", "02", "03"]
+    assert expand_range("1-3") == ("1", "2", "3")
+    assert expand_range("01-03") == ("01", "02", "03")
+
+
+def test_parse_nodelist_returns_cached_tuple():
+    nodes = parse_nodelist("node-[01-02,05],gpu-a")
+
+    assert nodes == ("node-01", "node-02", "node-05", "gpu-a")
+    assert parse_nodelist("node-[01-02,05],gpu-a") is nodes
+
+
+def test_parse_nodelist_plain_hosts_skip_range_expansion():
+    assert parse_nodelist("node-a") == ("node-a",)
+    assert parse_nodelist("node-a,node-b") == ("node-a", "node-b")